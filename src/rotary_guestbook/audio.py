@@ -2,7 +2,7 @@
 
 import abc
 import logging
-from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
 
 from pydub import AudioSegment
 from pydub.exceptions import CouldntDecodeError, CouldntEncodeError
@@ -235,7 +235,9 @@ class PyAudioBackend(AbstractAudioBackend):
         self._audio_settings: "AudioSettings" = config_manager.audio
         self._pyaudio_instance: Optional["pyaudio.PyAudio"] = None  # Lazy-loaded
         self._stream: Optional["pyaudio.Stream"] = None  # PyAudio stream
-        self._frames: List[bytes] = []
+        # Recorded audio is accumulated in one growing buffer rather than a list
+        # of per-callback chunks
+        self._frame_buf = bytearray()
         self._current_recording_filename: Optional[str] = None
         logger.info("PyAudioBackend initialized (PyAudio will be loaded on demand).")
 
@@ -356,7 +358,7 @@ class PyAudioBackend(AbstractAudioBackend):
             f"Width: {record_settings.sample_width}",
         ]
         logger.info(", ".join(log_parts))
-        self._frames = []
+        self._frame_buf.clear()
         try:
             pya = self._pyaudio_instance
             pya_format = pya.get_format_from_width(record_settings.sample_width)
@@ -402,13 +404,13 @@ class PyAudioBackend(AbstractAudioBackend):
         import pyaudio
 
         if in_data:
-            self._frames.append(in_data)
+            self._frame_buf.extend(in_data)
         return (None, pyaudio.paContinue)
 
     def stop_recording(self) -> None:
         """Stop the current audio recording and save it to a WAV file."""
         if self._stream is None:
-            if not self._frames:
+            if not self._frame_buf:
                 logger.warning(
                     "stop_recording: No stream and no frames. Nothing to do."
                 )
@@ -419,7 +421,7 @@ class PyAudioBackend(AbstractAudioBackend):
             pass  # Fall through to frame saving logic
         else:  # self._stream is not None
             stream = self._stream  # For type narrowing
-            if not stream.is_active() and not self._frames:
+            if not stream.is_active() and not self._frame_buf:
                 logger.warning(
                     "stop_recording: Stream inactive and no frames. Closing stream."
                 )
@@ -454,13 +456,13 @@ class PyAudioBackend(AbstractAudioBackend):
                 self._stream = None
 
         # At this point, self._stream is None. We might have frames.
-        if not self._frames:
+        if not self._frame_buf:
             logger.warning("No frames recorded, WAV file will not be created.")
             self._current_recording_filename = None
             return
 
-        # If we reach here, self._frames is not empty.
-        assert self._frames, "Frames should exist if we are proceeding to save."
+        # If we reach here, self._frame_buf is not empty.
+        assert self._frame_buf, "Frames should exist if we are proceeding to save."
 
         # record_settings will always exist due to Pydantic default_factory
         record_settings = self._audio_settings.recording
@@ -476,9 +478,10 @@ class PyAudioBackend(AbstractAudioBackend):
             raise AudioError("Internal error: output filename for recording not set.")
 
         logger.info(f"Saving recorded audio to {output_filename}")
+        payload = bytes(self._frame_buf)
         try:
             audio_segment = AudioSegment(
-                data=b"".join(self._frames),
+                data=payload,
                 sample_width=record_settings.sample_width,
                 frame_rate=record_settings.rate,
                 channels=record_settings.channels,
@@ -502,7 +505,7 @@ class PyAudioBackend(AbstractAudioBackend):
             )
         finally:
             # Always clear frames and filename after attempting to save
-            self._frames = []
+            self._frame_buf.clear()
             self._current_recording_filename = None
 
     def convert_to_mp3(self, input_wav: str, output_mp3: str) -> None:
@@ -18,6 +18,11 @@ from gpiozero.pins.rpigpio import RPiGPIOFactory
 from rotary_guestbook.audioInterface import AudioInterface
 from rotary_guestbook.logger import get_logger
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader
+
 logger = get_logger(__name__)
 Device.pin_factory = RPiGPIOFactory()
 
@@ -83,7 +88,7 @@ class AudioGuestBook:
         """
         try:
             with open(self.config_path, "r") as f:
-                return yaml.safe_load(f)
+                return yaml.load(f, Loader=SafeLoader)
         except FileNotFoundError as e:
             logger.error(f"Configuration file not found: {e}")
             sys.exit(1)
@@ -20,12 +20,13 @@ Example:
     ```
 """
 
+import io
 import os
 import warnings
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from ruamel.yaml import YAML
 
 from rotary_guestbook.errors import ConfigError
@@ -34,6 +35,8 @@ from rotary_guestbook.errors import ConfigError
 class RecordingSettings(BaseModel):
     """Settings related to audio recording parameters."""
 
+    model_config = ConfigDict(frozen=True)
+
     input_device_index: Optional[int] = None  # PyAudio device index
     channels: int = Field(default=1, ge=1, le=2)
     rate: int = Field(default=44100, ge=8000, le=192000)
@@ -51,6 +54,8 @@ class RecordingSettings(BaseModel):
 class ConversionSettings(BaseModel):
     """Settings related to audio file conversion, e.g., to MP3."""
 
+    model_config = ConfigDict(frozen=True)
+
     mp3_bitrate: str = "192k"
     # Example: ["-ac", "1"] for mono, ["-q:a", "5"] for VBR quality
     ffmpeg_parameters: Optional[List[str]] = None
@@ -62,6 +67,8 @@ class AudioSettings(BaseModel):
     Defines audio-related parameters like devices, recording, and formats.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     output_device_index: Optional[int] = None
     greeting_message_path: Optional[str] = None
     min_recording_time: int = Field(default=3, ge=1, le=60)
@@ -96,6 +103,8 @@ class HardwareSettings(BaseModel):
         rotary_pulse_debounce: Debounce time for rotary pulses in milliseconds
     """
 
+    model_config = ConfigDict(frozen=True)
+
     hook_switch_pin: int = Field(default=17, ge=0, le=27)
     rotary_pulse_pin: int = Field(default=27, ge=0, le=27)
     rotary_dial_pin: int = Field(default=22, ge=0, le=27)
@@ -119,6 +128,8 @@ class WebSettings(BaseModel):
         auth_password: Password for authentication
     """
 
+    model_config = ConfigDict(frozen=True)
+
     host: str = "0.0.0.0"
     port: int = Field(default=5000, ge=1024, le=65535)
     debug: bool = False
@@ -142,6 +153,8 @@ class LoggingSettings(BaseModel):
         backup_count: Number of backup log files to keep
     """
 
+    model_config = ConfigDict(frozen=True)
+
     level: str = "INFO"
     format: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     file: str = "guestbook.log"
@@ -185,6 +198,8 @@ class SystemSettings(BaseModel):
         archive_backup_location: Location for archived files
     """
 
+    model_config = ConfigDict(frozen=True)
+
     health_check_interval: int = Field(default=300, ge=60)
     disk_space_threshold: int = Field(default=90, ge=50, le=100)
     cpu_usage_threshold: int = Field(default=80, ge=50, le=100)
@@ -209,6 +224,8 @@ class Config(BaseModel):
         system: System configuration settings
     """
 
+    model_config = ConfigDict(frozen=True)
+
     audio: AudioSettings = Field(default_factory=AudioSettings)
     hardware: HardwareSettings = Field(default_factory=HardwareSettings)
     web: WebSettings = Field(default_factory=WebSettings)
@@ -229,6 +246,9 @@ class ConfigManager:
         yaml: YAML parser instance
 
     Note:
+        The settings models are frozen. To change a value before calling
+        `save_config`, replace `config` with an updated `model_copy`.
+
         The methods `get_audio_config`, `get_hardware_config`, etc., are
         deprecated. Use the respective properties (`.audio`, `.hardware`) instead.
     """
@@ -243,9 +263,23 @@ class ConfigManager:
             ConfigError: If the configuration file cannot be loaded or validated
         """
         self.config_path = Path(config_path)
-        self.yaml = YAML()
+        self.yaml = self._new_yaml()
         self.config = self._load_config()
 
+    @staticmethod
+    def _new_yaml() -> YAML:
+        """Create the YAML parser used to load config files."""
+        # The safe loader uses the libyaml-based C parser when ruamel.yaml.clib
+        # is installed, and falls back to the pure-Python parser otherwise.
+        return YAML(typ="safe")
+
+    @staticmethod
+    def _new_dumper() -> YAML:
+        """Create the YAML emitter used to save config files."""
+        # The round-trip emitter keeps the model's field order and writes None
+        # as an empty value; the safe emitter would sort keys and write null.
+        return YAML()
+
     def _load_config(self) -> Config:
         """Load configuration from the YAML file and validate it."""
         try:
@@ -272,12 +306,21 @@ class ConfigManager:
                 f"Error loading {self.config_path}: {str(e)}",
             )
 
+    def _serialize(self) -> Dict[str, Any]:
+        """Return the current configuration as plain data for the YAML file."""
+        return self.config.model_dump()
+
+    def _write(self, path: Path, data: str) -> None:
+        """Write the serialized configuration text to a file."""
+        with path.open("w") as f:
+            f.write(data)
+
     def save_config(self) -> None:
         """Save the current configuration back to the YAML file."""
         try:
-            config_dict = self.config.model_dump()
-            with self.config_path.open("w") as f:
-                self.yaml.dump(config_dict, f)
+            buf = io.StringIO()
+            self._new_dumper().dump(self._serialize(), buf)
+            self._write(self.config_path, buf.getvalue())
         except Exception as e:
             raise ConfigError(
                 "Failed to save configuration",
@@ -18,8 +18,55 @@ Example:
 import logging
 import logging.handlers
 from pathlib import Path
+from typing import List
 
-from rotary_guestbook.config import ConfigManager
+from rotary_guestbook.config import ConfigManager, LoggingSettings
+
+
+def _build_handlers(
+    log_settings: LoggingSettings, *, delay: bool = False
+) -> List[logging.Handler]:
+    """Create the console and rotating file handlers for the logging settings.
+
+    Args:
+        log_settings: The logging settings; the level must already be validated.
+        delay: Defer opening the log file until the first record is written.
+
+    Returns:
+        The console handler followed by the rotating file handler.
+
+    Raises:
+        OSError: If there are issues creating or accessing the log directory.
+    """
+    numeric_level = getattr(logging, log_settings.level.upper())
+    log_file = Path(log_settings.file)
+
+    # Create formatter
+    formatter = logging.Formatter(log_settings.format)
+
+    # Console handler
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(formatter)
+
+    # File handler
+    try:
+        # Ensure log directory exists
+        log_file.parent.mkdir(parents=True, exist_ok=True)
+        file_handler = logging.handlers.RotatingFileHandler(
+            log_file,
+            maxBytes=log_settings.max_size,
+            backupCount=log_settings.backup_count,
+            encoding="utf-8",
+            delay=delay,
+        )
+        file_handler.setFormatter(formatter)
+        file_handler.setLevel(numeric_level)
+    except OSError as e:
+        # Nothing will own the console handler, so release it here
+        console_handler.close()
+        raise OSError(f"Failed to set up file logging: {e}") from e
+
+    return [console_handler, file_handler]
 
 
 def setup_logging(config_manager: ConfigManager) -> None:
@@ -35,10 +82,6 @@ def setup_logging(config_manager: ConfigManager) -> None:
     # Get logging settings from config
     log_settings = config_manager.config.logging
     log_level = log_settings.level.upper()
-    log_format = log_settings.format
-    log_file = Path(log_settings.file)
-    max_bytes = log_settings.max_size
-    backup_count = log_settings.backup_count
 
     # Validate log level
     valid_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
@@ -50,34 +93,14 @@ def setup_logging(config_manager: ConfigManager) -> None:
     # Get numeric log level
     numeric_level = getattr(logging, log_level)
 
-    # Create formatter
-    formatter = logging.Formatter(log_format)
+    handlers = _build_handlers(log_settings)
 
-    # Remove existing handlers
+    # Replace existing handlers
     root_logger = logging.getLogger()
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
-
-    # Add console handler
-    console_handler = logging.StreamHandler()
-    console_handler.setFormatter(formatter)
-    root_logger.addHandler(console_handler)
-
-    # Add file handler
-    try:
-        # Ensure log directory exists
-        log_file.parent.mkdir(parents=True, exist_ok=True)
-        file_handler = logging.handlers.RotatingFileHandler(
-            log_file,
-            maxBytes=max_bytes,
-            backupCount=backup_count,
-            encoding="utf-8",
-        )
-        file_handler.setFormatter(formatter)
-        file_handler.setLevel(numeric_level)
-        root_logger.addHandler(file_handler)
-    except OSError as e:
-        raise OSError(f"Failed to set up file logging: {e}") from e
+    for handler in handlers:
+        root_logger.addHandler(handler)
 
     # Set root logger level
     root_logger.setLevel(numeric_level)
@@ -86,9 +109,9 @@ def setup_logging(config_manager: ConfigManager) -> None:
     root_logger.info("Logging system initialized")
     root_logger.debug(
         "Log file: %s, max size: %d bytes, backup count: %d",
-        log_file,
-        max_bytes,
-        backup_count,
+        log_settings.file,
+        log_settings.max_size,
+        log_settings.backup_count,
     )
 
 
@@ -2,12 +2,15 @@
 
 import sys
 from pathlib import Path
-from typing import Any, Dict, Generator, Tuple
+from typing import Any, Dict, Generator, Tuple, Type
 from unittest.mock import MagicMock, patch
 
 import pytest
 import yaml
 
+# libyaml's C dumper when PyYAML was built with it, the pure-Python one otherwise
+SafeDumper: Type[yaml.SafeDumper] = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 # Mock hardware-specific modules for non-Raspberry Pi environments
 gpio_mocks = [
     "RPi",
@@ -20,6 +23,16 @@ for mod in gpio_mocks:
     sys.modules[mod] = MagicMock()
 
 
+@pytest.fixture(scope="session")
+def safe_dumper() -> Type[yaml.SafeDumper]:
+    """Provide the fastest available PyYAML safe dumper class.
+
+    Returns:
+        ``yaml.CSafeDumper`` if PyYAML has libyaml support, else ``yaml.SafeDumper``.
+    """
+    return SafeDumper
+
+
 @pytest.fixture
 def tmp_config_file(tmp_path: Path) -> Path:
     """Create a temporary configuration file for testing.
@@ -81,71 +94,3 @@ def mock_subprocess() -> Generator[Tuple[MagicMock, MagicMock], None, None]:
             wait=MagicMock(return_value=0),
         )
         yield mock_run, mock_popen
-
-
-@pytest.fixture
-def mock_audio_interface() -> Generator[MagicMock, None, None]:
-    """Create a mock AudioInterface instance.
-
-    Yields:
-        A MagicMock instance of AudioInterface.
-    """
-    with patch("src.audioGuestBook.AudioInterface") as mock:
-        instance = mock.return_value
-        instance.play_audio = MagicMock()
-        instance.start_recording = MagicMock()
-        instance.stop_recording = MagicMock()
-        instance.stop_playback = MagicMock()
-        yield instance
-
-
-@pytest.fixture
-def mock_button() -> Generator[MagicMock, None, None]:
-    """Create a mock gpiozero.Button instance.
-
-    Yields:
-        A MagicMock instance of Button.
-    """
-    with patch("src.audioGuestBook.Button") as mock:  # Adjusted path if necessary
-        instance = mock.return_value
-        instance.when_pressed = None
-        instance.when_released = None
-        yield instance
-
-
-@pytest.fixture
-def mock_config() -> Dict[str, Any]:
-    """Create a mock configuration dictionary for testing.
-
-    Returns:
-        A dictionary representing a mock configuration.
-    """
-    return {
-        "recordings_path": "/tmp/recordings",
-        "alsa_hw_mapping": "hw:0,0",
-        "format": "cd",
-        "file_type": "wav",
-        "recording_limit": 30,
-        "sample_rate": 44100,
-        "channels": 1,
-        "mixer_control_name": "Speaker",
-        "hook_gpio": 17,
-        "hook_type": "NC",
-        "invert_hook": False,
-        "hook_bounce_time": 0.1,
-        "greeting": "/tmp/greeting.wav",
-        "greeting_volume": 0.8,
-        "greeting_start_delay": 0,
-        "beep": "/tmp/beep.wav",
-        "beep_volume": 0.8,
-        "beep_start_delay": 0,
-        "beep_include_in_message": True,
-        "time_exceeded": "/tmp/time_exceeded.wav",
-        "time_exceeded_volume": 0.8,
-        "time_exceeded_length": 30,
-        "record_greeting_gpio": 27,
-        "record_greeting_type": "NC",
-        "record_greeting_bounce_time": 0.1,
-        "shutdown_gpio": 22,
-        "shutdown_button_hold_time": 2,
-    }
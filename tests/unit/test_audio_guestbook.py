@@ -1,6 +1,6 @@
-import threading
 from pathlib import Path
-from unittest.mock import MagicMock, Mock, patch
+from types import MappingProxyType
+from unittest.mock import ANY, DEFAULT, MagicMock, Mock, call, patch
 
 import pytest
 import yaml
@@ -8,72 +8,144 @@ import yaml
 from rotary_guestbook.audioGuestBook import AudioGuestBook, CurrentEvent
 
 
-@pytest.fixture
-def mock_config():
-    """Create a mock configuration for testing."""
-    return {
-        "recordings_path": "/tmp/recordings",
-        "alsa_hw_mapping": "hw:0,0",
-        "format": "cd",
-        "file_type": "wav",
-        "recording_limit": 30,
-        "sample_rate": 44100,
-        "channels": 1,
-        "mixer_control_name": "Speaker",
-        "hook_gpio": 17,
-        "hook_type": "NC",
-        "invert_hook": False,
-        "hook_bounce_time": 0.1,
-        "greeting": "/path/to/greeting.wav",
-        "greeting_volume": 0.8,
-        "greeting_start_delay": 0,
-        "beep": "/path/to/beep.wav",
-        "beep_volume": 0.8,
-        "beep_start_delay": 0,
-        "beep_include_in_message": True,
-        "time_exceeded": "/path/to/time_exceeded.wav",
-        "time_exceeded_volume": 0.8,
-        "time_exceeded_length": 30,
-        "record_greeting_gpio": 27,
-        "record_greeting_type": "NC",
-        "record_greeting_bounce_time": 0.1,
-        "shutdown_gpio": 22,
-        "shutdown_button_hold_time": 2,
-    }  # noqa: E501
+class _FakeThread:
+    """Stand-in for a greeting thread that has already finished."""
+
+    def is_alive(self):
+        return False
+
+    def join(self, *args, **kwargs):
+        pass
+
+    def start(self):
+        pass
+
+
+def assert_call_order(mock_obj, *expected_calls):
+    """Assert the expected calls appear on mock_obj exactly in the given order."""
+    seq = [c for c in mock_obj.mock_calls if c in expected_calls]
+    assert seq == list(expected_calls)
+
+
+@pytest.fixture(scope="session")
+def _base_config():
+    """Return the read-only base test configuration, built once per session."""
+    return MappingProxyType(
+        {
+            "recordings_path": "/tmp/recordings",
+            "alsa_hw_mapping": "hw:0,0",
+            "format": "cd",
+            "file_type": "wav",
+            "recording_limit": 30,
+            "sample_rate": 44100,
+            "channels": 1,
+            "mixer_control_name": "Speaker",
+            "hook_gpio": 17,
+            "hook_type": "NC",
+            "invert_hook": False,
+            "hook_bounce_time": 0.1,
+            "greeting": "/path/to/greeting.wav",
+            "greeting_volume": 0.8,
+            "greeting_start_delay": 0,
+            "beep": "/path/to/beep.wav",
+            "beep_volume": 0.8,
+            "beep_start_delay": 0,
+            "beep_include_in_message": True,
+            "time_exceeded": "/path/to/time_exceeded.wav",
+            "time_exceeded_volume": 0.8,
+            "time_exceeded_length": 30,
+            "record_greeting_gpio": 27,
+            "record_greeting_type": "NC",
+            "record_greeting_bounce_time": 0.1,
+            "shutdown_gpio": 22,
+            "shutdown_button_hold_time": 2,
+        }
+    )
 
 
 @pytest.fixture
-def mock_audio_interface():
-    """Create a mock AudioInterface instance."""
+def mock_config(_base_config):
+    """Create a mutable copy of the test configuration."""
+    return dict(_base_config)
+
+
+@pytest.fixture(scope="session")
+def _config_path(tmp_path_factory, _base_config, safe_dumper):
+    """Write the test configuration to a YAML file once per session."""
+    config_path = tmp_path_factory.mktemp("config") / "config.yaml"
+    with open(config_path, "w") as f:
+        yaml.dump(dict(_base_config), f, Dumper=safe_dumper, sort_keys=False)
+    return config_path
+
+
+@pytest.fixture(scope="session")
+def _audio_fixtures(tmp_path_factory):
+    """Create empty greeting/beep files and a recordings folder once."""
+    root = tmp_path_factory.mktemp("audio")
+    (root / "greeting.wav").touch()
+    (root / "beep.wav").touch()
+    (root / "recordings").mkdir()
+    return root
+
+
+@pytest.fixture(scope="session")
+def _audio_files(_audio_fixtures):
+    """Return the shared (greeting, beep) dummy audio paths."""
+    return _audio_fixtures / "greeting.wav", _audio_fixtures / "beep.wav"
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _preimport():
+    """Import audioGuestBook once per session and return the module object."""
+    import rotary_guestbook.audioGuestBook as audio_guest_book_module
+
+    return audio_guest_book_module
+
+
+@pytest.fixture(scope="module")
+def _patches(_preimport):
+    """Patch AudioInterface and Button together, once for the whole module."""
     # Reverting to simple MagicMock as autospec didn't solve the main issue
     # and complicated test_init.
-    with patch("rotary_guestbook.audioGuestBook.AudioInterface") as mock_class:
-        yield mock_class.return_value
+    # Patching the module object skips resolving the dotted target path.
+    with patch.multiple(_preimport, AudioInterface=DEFAULT, Button=DEFAULT) as mocks:
+        yield mocks["AudioInterface"], mocks["Button"]
+
+
+@pytest.fixture(autouse=True)
+def _reset_patched_classes(_patches):
+    """Give each test fresh instances from the module-scoped class mocks."""
+    for mock_class in _patches:
+        mock_class.reset_mock(side_effect=True)
+        mock_class.return_value = MagicMock()
 
 
 @pytest.fixture
-def mock_button():
-    """Create a mock Button CLASS and yield it."""
-    with patch("rotary_guestbook.audioGuestBook.Button") as mock_class:
-        # The code under test will call mock_class() to get an instance.
-        # That instance (mock_class.return_value) will be a MagicMock
-        # by default. Attributes like .when_pressed are set by the code
-        # on this instance.
-        yield mock_class
+def mock_audio_interface(_patches):
+    """Return the mock AudioInterface instance for the current test."""
+    audio_interface_class, _ = _patches
+    return audio_interface_class.return_value
 
 
 @pytest.fixture
-def guest_book(mock_config, tmp_path, mock_audio_interface, mock_button, request):
-    """Create an AudioGuestBook instance with test configuration."""
-    # Create a temporary config file
-    config_path = tmp_path / "config.yaml"
-    with open(config_path, "w") as f:
-        yaml.dump(mock_config, f)
+def mock_button(_patches):
+    """Return the mock Button CLASS for the current test."""
+    _, button_class = _patches
+    # The code under test will call mock_class() to get an instance.
+    # That instance (mock_class.return_value) will be a MagicMock
+    # by default. Attributes like .when_pressed are set by the code
+    # on this instance.
+    return button_class
 
-    # The AudioGuestBook will pick up the mocks when it tries to import Button
-    # and AudioInterface, because the mock_audio_interface and mock_button
-    # fixtures have already patched them.
-    gb_instance = AudioGuestBook(str(config_path))
+
+@pytest.fixture
+def guest_book(_config_path, mock_audio_interface, request):
+    """Create an AudioGuestBook instance with test configuration."""
+    # Each instance parses its own config dict from the shared file, so tests
+    # can mutate guest_book.config freely.
+    # The AudioGuestBook will pick up the mocked AudioInterface and Button
+    # because the module-scoped patches are already active.
+    gb_instance = AudioGuestBook(str(_config_path))
 
     def finalizer():
         # Ensure all threads and timers are stopped
@@ -83,6 +155,27 @@ def guest_book(mock_config, tmp_path, mock_audio_interface, mock_button, request
     return gb_instance
 
 
+@pytest.fixture
+def mutable_guest_book(
+    mock_config, tmp_path, mock_audio_interface, request, safe_dumper
+):
+    """Return a factory building an AudioGuestBook from the current mock_config.
+
+    Use this instead of ``guest_book`` when a test must change the config
+    before construction; the config is dumped to a per-test file on each call.
+    """
+
+    def _build():
+        config_path = tmp_path / "config.yaml"
+        with open(config_path, "w") as f:
+            yaml.dump(mock_config, f, Dumper=safe_dumper, sort_keys=False)
+        gb_instance = AudioGuestBook(str(config_path))
+        request.addfinalizer(gb_instance.stop_recording_and_playback)
+        return gb_instance
+
+    return _build
+
+
 def test_init(guest_book, mock_config):
     """Test AudioGuestBook initialization."""
     assert guest_book.config == mock_config
@@ -97,85 +190,84 @@ def test_load_config_file_not_found(tmp_path):
         AudioGuestBook(str(tmp_path / "nonexistent.yaml"))
 
 
-def test_setup_hook_nc(guest_book, mock_button):
-    """Test hook setup for NC type."""
-    guest_book.config["hook_type"] = "NC"
-    guest_book.config["invert_hook"] = False
-
-    mock_button.reset_mock()  # Reset calls from __init__
-    guest_book.setup_hook()
-
-    # Verify button was created with correct parameters
-    mock_button.assert_called_once_with(17, pull_up=True, bounce_time=0.1)
-
-    # Verify event handlers were set correctly
-    assert mock_button.return_value.when_pressed == guest_book.off_hook
-    assert mock_button.return_value.when_released == guest_book.on_hook
-
-
-def test_setup_hook_no(guest_book, mock_button):
-    """Test hook setup for NO type."""
-    guest_book.config["hook_type"] = "NO"
-    guest_book.config["invert_hook"] = False
+@pytest.mark.parametrize(
+    "hook_type,invert_hook,pull_up,pressed_handler,released_handler",
+    [
+        ("NC", False, True, "off_hook", "on_hook"),
+        ("NO", False, False, "on_hook", "off_hook"),
+        ("NC", True, True, "on_hook", "off_hook"),
+        ("NO", True, False, "off_hook", "on_hook"),
+    ],
+)
+def test_setup_hook(
+    guest_book,
+    mock_button,
+    hook_type,
+    invert_hook,
+    pull_up,
+    pressed_handler,
+    released_handler,
+):
+    """Test hook setup for each hook type, with and without invert_hook."""
+    guest_book.config["hook_type"] = hook_type
+    guest_book.config["invert_hook"] = invert_hook
 
     mock_button.reset_mock()  # Reset calls from __init__
     guest_book.setup_hook()
 
     # Verify button was created with correct parameters
-    mock_button.assert_called_once_with(17, pull_up=False, bounce_time=0.1)
+    mock_button.assert_called_once_with(17, pull_up=pull_up, bounce_time=0.1)
 
     # Verify event handlers were set correctly
-    assert mock_button.return_value.when_pressed == guest_book.on_hook
-    assert mock_button.return_value.when_released == guest_book.off_hook
-
-
-def test_setup_hook_nc_inverted(guest_book, mock_button):
-    """Test hook setup for NC type with invert_hook=True."""
-    guest_book.config["hook_type"] = "NC"
-    guest_book.config["invert_hook"] = True
-
-    mock_button.reset_mock()  # Reset calls from __init__
-    guest_book.setup_hook()
-
-    # Verify button was created with correct parameters
-    mock_button.assert_called_once_with(17, pull_up=True, bounce_time=0.1)
-
-    # Verify event handlers were set for inverted NC
-    assert mock_button.return_value.when_released == guest_book.off_hook
-    assert mock_button.return_value.when_pressed == guest_book.on_hook
-
+    assert mock_button.return_value.when_pressed == getattr(guest_book, pressed_handler)
+    assert mock_button.return_value.when_released == getattr(
+        guest_book, released_handler
+    )
 
-def test_setup_hook_no_inverted(guest_book, mock_button):
-    """Test hook setup for NO type with invert_hook=True."""
-    guest_book.config["hook_type"] = "NO"
-    guest_book.config["invert_hook"] = True
 
-    mock_button.reset_mock()  # Reset calls from __init__
-    guest_book.setup_hook()
+@pytest.fixture
+def patch_thread():
+    """Replace threading in audioGuestBook so no real threads are started.
+
+    Yields the mock Thread class; the threads it creates report as alive.
+    """
+    with patch("rotary_guestbook.audioGuestBook.threading") as mock_threading:
+        mock_threading.Thread.return_value.is_alive.return_value = True
+        yield mock_threading.Thread
+
+
+@pytest.mark.parametrize(
+    "method,blocking_event",
+    [
+        ("off_hook", CurrentEvent.RECORD_GREETING),
+        ("pressed_record_greeting", CurrentEvent.HOOK),
+    ],
+)
+def test_event_ignored_when_busy(
+    guest_book, mock_audio_interface, patch_thread, method, blocking_event
+):
+    """Test handlers do nothing while another event is in progress."""
+    guest_book.current_event = blocking_event
+    mock_audio_interface.reset_mock()
 
-    # Verify button was created with correct parameters
-    mock_button.assert_called_once_with(17, pull_up=False, bounce_time=0.1)
+    getattr(guest_book, method)()
 
-    # Verify event handlers were set for inverted NO
-    assert mock_button.return_value.when_released == guest_book.on_hook
-    assert mock_button.return_value.when_pressed == guest_book.off_hook
+    mock_audio_interface.play_audio.assert_not_called()
+    mock_audio_interface.start_recording.assert_not_called()
+    patch_thread.assert_not_called()
+    assert guest_book.current_event == blocking_event
 
 
-def test_off_hook(guest_book, mock_audio_interface):
+def test_off_hook(guest_book, patch_thread):
     """Test off-hook event handling."""
-    # Simulate another event in progress
-    guest_book.current_event = CurrentEvent.RECORD_GREETING
-    guest_book.off_hook()
-    mock_audio_interface.play_audio.assert_not_called()
-
-    # Reset state and test normal off-hook
     guest_book.current_event = CurrentEvent.NONE
     guest_book.off_hook()
 
     # Verify greeting playback was started
     assert guest_book.current_event == CurrentEvent.HOOK
-    assert isinstance(guest_book.greeting_thread, threading.Thread)
-    assert guest_book.greeting_thread.is_alive()
+    patch_thread.assert_called_once_with(target=guest_book.play_greeting_and_beep)
+    assert guest_book.greeting_thread is patch_thread.return_value
+    guest_book.greeting_thread.start.assert_called_once()
 
 
 def test_on_hook(guest_book, mock_audio_interface):
@@ -183,15 +275,14 @@ def test_on_hook(guest_book, mock_audio_interface):
     assert guest_book.audio_interface is mock_audio_interface
 
     guest_book.current_event = CurrentEvent.HOOK
-    guest_book.greeting_thread = threading.Thread(target=lambda: None)
-    guest_book.greeting_thread.start()
+    guest_book.greeting_thread = _FakeThread()
 
     mock_audio_interface.stop_recording.reset_mock()
     mock_audio_interface.stop_playback.reset_mock()
 
     # Explicitly set up mock attributes that will be checked/used
-    mock_audio_interface.recording_process = MagicMock()
-    mock_audio_interface.playback_process = MagicMock()
+    mock_audio_interface.recording_process = object()
+    mock_audio_interface.playback_process = object()
     mock_audio_interface.stop_recording.side_effect = None
 
     assert guest_book.audio_interface.recording_process  # Verify truthy
@@ -204,22 +295,18 @@ def test_on_hook(guest_book, mock_audio_interface):
     mock_audio_interface.stop_playback.assert_called_once()
 
 
-def test_play_greeting_and_beep(guest_book, mock_audio_interface, tmp_path):
+def test_play_greeting_and_beep(
+    guest_book, mock_audio_interface, _audio_files, _audio_fixtures
+):
     """Test greeting and beep playback sequence."""
-    # Create temporary audio files
-    greeting_file = tmp_path / "greeting.wav"
-    beep_file = tmp_path / "beep.wav"
-    greeting_file.touch()
-    beep_file.touch()
+    greeting_file, beep_file = _audio_files
 
     guest_book.config["greeting"] = str(greeting_file)
     guest_book.config["beep"] = str(beep_file)
     guest_book.config["beep_include_in_message"] = True
 
     # Set up recording path
-    recordings_path = tmp_path / "recordings"
-    recordings_path.mkdir()
-    guest_book.config["recordings_path"] = str(recordings_path)
+    guest_book.config["recordings_path"] = str(_audio_fixtures / "recordings")
 
     # Ensure event is HOOK for beep
     guest_book.current_event = CurrentEvent.HOOK
@@ -236,21 +323,16 @@ def test_play_greeting_and_beep(guest_book, mock_audio_interface, tmp_path):
 
 
 def test_play_greeting_and_beep_record_after_beep(
-    guest_book, mock_audio_interface, tmp_path
+    guest_book, mock_audio_interface, _audio_files, _audio_fixtures
 ):
     """Test greeting and beep sequence with recording starting after beep."""
-    greeting_file = tmp_path / "greeting.wav"
-    beep_file = tmp_path / "beep.wav"
-    greeting_file.touch()
-    beep_file.touch()
+    greeting_file, beep_file = _audio_files
 
     guest_book.config["greeting"] = str(greeting_file)
     guest_book.config["beep"] = str(beep_file)
     guest_book.config["beep_include_in_message"] = False  # Key change
 
-    recordings_path = tmp_path / "recordings"
-    recordings_path.mkdir()
-    guest_book.config["recordings_path"] = str(recordings_path)
+    guest_book.config["recordings_path"] = str(_audio_fixtures / "recordings")
 
     guest_book.current_event = CurrentEvent.HOOK
 
@@ -263,47 +345,16 @@ def test_play_greeting_and_beep_record_after_beep(
     mock_audio_interface.play_audio.assert_any_call(str(greeting_file), 0.8, 0)
     mock_audio_interface.play_audio.assert_any_call(str(beep_file), 0.8, 0)
 
-    # Verify recording was started (we need its args for ordering)
+    # Verify recording was started
     mock_audio_interface.start_recording.assert_called_once()
-    # output_file_name = mock_audio_interface.start_recording.call_args.args[0]
-
-    # Check the order of calls: beep should be played before recording starts
-    # Greeting is played even before beep.
-    # from unittest.mock import call # Removed unused import
-
-    # Expected sequence of relevant calls:
-    # 1. play_audio(greeting_file, ...)
-    # 2. play_audio(beep_file, ...)
-    # 3. start_recording(...)
-
-    # Find the calls in the mock_calls list
-    greeting_call_index = -1
-    beep_call_index = -1
-    start_recording_call_index = -1
-
-    for idx, c_obj in enumerate(mock_audio_interface.mock_calls):
-        method_name = c_obj[0]  # Name of the method as string
-        args = c_obj[1]  # Tuple of arguments
-        # kwargs = c_obj[2]     # Dictionary of keyword arguments (if any)
-
-        if method_name == "play_audio":
-            if args[0] == str(greeting_file):
-                greeting_call_index = idx
-            elif args[0] == str(beep_file):
-                beep_call_index = idx
-        elif method_name == "start_recording":
-            start_recording_call_index = idx
-
-    assert greeting_call_index != -1, "Greeting play_audio call not found in mock_calls"
-    assert beep_call_index != -1, "Beep play_audio call not found in mock_calls"
-    assert (
-        start_recording_call_index != -1
-    ), "start_recording call not found in mock_calls"
-
-    assert greeting_call_index < beep_call_index, "Greeting was not played before beep"
-    assert (
-        beep_call_index < start_recording_call_index
-    ), "start_recording was not called after beep"
+
+    # Greeting, then beep, then recording (the beep is not in the message)
+    assert_call_order(
+        mock_audio_interface,
+        call.play_audio(str(greeting_file), 0.8, 0),
+        call.play_audio(str(beep_file), 0.8, 0),
+        call.start_recording(ANY),
+    )
 
 
 def test_time_exceeded(guest_book, mock_audio_interface):
@@ -317,40 +368,63 @@ def test_time_exceeded(guest_book, mock_audio_interface):
     )
 
 
-def test_setup_record_greeting(guest_book, mock_button):
-    """Test record greeting button setup."""
+@pytest.mark.parametrize(
+    "method,gpio_key,gpio_val,expected_kwargs,handlers",
+    [
+        (
+            "setup_record_greeting",
+            "record_greeting_gpio",
+            27,
+            dict(pull_up=True, bounce_time=0.1),
+            dict(
+                when_pressed="pressed_record_greeting",
+                when_released="released_record_greeting",
+            ),
+        ),
+        (
+            "setup_shutdown_button",
+            "shutdown_gpio",
+            22,
+            dict(pull_up=True, hold_time=2),
+            dict(when_held="shutdown"),
+        ),
+        ("setup_record_greeting", "record_greeting_gpio", 0, None, None),
+        ("setup_shutdown_button", "shutdown_gpio", 0, None, None),
+    ],
+)
+def test_setup_button(
+    guest_book, mock_button, method, gpio_key, gpio_val, expected_kwargs, handlers
+):
+    """Test button setup, and that a GPIO of 0 disables the button."""
+    guest_book.config[gpio_key] = gpio_val
     mock_button.reset_mock()  # Reset calls from __init__
-    guest_book.setup_record_greeting()
 
-    # Verify button was created with correct parameters
-    mock_button.assert_called_once_with(27, pull_up=True, bounce_time=0.1)
+    getattr(guest_book, method)()
 
-    # Verify event handlers were set correctly
-    assert mock_button.return_value.when_pressed == guest_book.pressed_record_greeting
-    assert mock_button.return_value.when_released == guest_book.released_record_greeting
+    if expected_kwargs is None:
+        mock_button.assert_not_called()
+        return
 
+    # Verify button was created with correct parameters
+    mock_button.assert_called_once_with(gpio_val, **expected_kwargs)
 
-def test_setup_record_greeting_disabled(guest_book, mock_button):
-    """Test record greeting setup when disabled."""
-    guest_book.config["record_greeting_gpio"] = 0
-    mock_button.reset_mock()  # Reset calls from __init__
-    guest_book.setup_record_greeting()
-    mock_button.assert_not_called()
+    # Verify event handlers were set correctly
+    for event, handler in handlers.items():
+        assert getattr(mock_button.return_value, event) == getattr(guest_book, handler)
 
 
 def test_stop_recording_and_playback(guest_book, mock_audio_interface):
     """Test stopping recording and playback."""
     assert guest_book.audio_interface is mock_audio_interface
 
-    guest_book.greeting_thread = threading.Thread(target=lambda: None)
-    guest_book.greeting_thread.start()
+    guest_book.greeting_thread = _FakeThread()
 
     mock_audio_interface.stop_recording.reset_mock()
     mock_audio_interface.stop_playback.reset_mock()
 
     # Explicitly set up mock attributes that will be checked/used
-    mock_audio_interface.recording_process = MagicMock()
-    mock_audio_interface.playback_process = MagicMock()
+    mock_audio_interface.recording_process = object()
+    mock_audio_interface.playback_process = object()
     mock_audio_interface.stop_recording.side_effect = None
 
     assert guest_book.audio_interface.recording_process  # Verify truthy
@@ -366,39 +440,16 @@ def test_stop_recording_and_playback(guest_book, mock_audio_interface):
         assert not guest_book.timer.is_alive()
 
 
-def test_pressed_record_greeting_when_busy(guest_book, mock_audio_interface):
-    """Test pressed_record_greeting is ignored if another event is active."""
-    guest_book.current_event = CurrentEvent.HOOK  # Simulate another event
-    mock_audio_interface.reset_mock()
-
-    guest_book.pressed_record_greeting()
-
-    mock_audio_interface.play_audio.assert_not_called()
-    mock_audio_interface.start_recording.assert_not_called()
-    assert guest_book.current_event == CurrentEvent.HOOK
-    assert (
-        not hasattr(guest_book, "greeting_thread")
-        or guest_book.greeting_thread.target != guest_book.beep_and_record_greeting
-    )
-
-
-def test_pressed_record_greeting_starts_sequence(guest_book, mock_audio_interface):
+def test_pressed_record_greeting_starts_sequence(guest_book, patch_thread):
     """Test pressed_record_greeting starts the beep_and_record_greeting sequence."""
     guest_book.current_event = CurrentEvent.NONE
 
-    # Patch the target method of the thread to verify it's called
-    with patch.object(guest_book, "beep_and_record_greeting") as mock_beep_and_record:
-        guest_book.pressed_record_greeting()
-
-        assert guest_book.current_event == CurrentEvent.RECORD_GREETING
-        assert isinstance(guest_book.greeting_thread, threading.Thread)
-        # guest_book.greeting_thread.is_alive() is likely False as mock runs fast.
-        # The key is that the mock target was called.
+    guest_book.pressed_record_greeting()
 
-        # The mock should be called by the thread. If the thread daemon status matters
-        # or if it needs more time, this might need adjustment.
-        # For a simple mock call, this should be near-instantaneous.
-        mock_beep_and_record.assert_called_once()
+    assert guest_book.current_event == CurrentEvent.RECORD_GREETING
+    patch_thread.assert_called_once_with(target=guest_book.beep_and_record_greeting)
+    assert guest_book.greeting_thread is patch_thread.return_value
+    guest_book.greeting_thread.start.assert_called_once()
 
 
 def test_released_record_greeting_when_not_recording_greeting(guest_book):
@@ -458,66 +509,24 @@ def test_beep_and_record_greeting(guest_book, mock_audio_interface, tmp_path):
     )
 
     # Check call order: beep before recording
-    beep_call_index = -1
-    start_recording_call_index = -1
-
-    for idx, c_obj in enumerate(mock_audio_interface.mock_calls):
-        method_name = c_obj[0]
-        args = c_obj[1]
-        if method_name == "play_audio" and args[0] == beep_file:
-            beep_call_index = idx
-        elif (
-            method_name == "start_recording"
-            and args[0] == greeting_file_path_for_method
-        ):
-            start_recording_call_index = idx
-
-    assert beep_call_index != -1, "Beep play_audio call not found"
-    assert start_recording_call_index != -1, "Greeting start_recording call not found"
-    assert (
-        beep_call_index < start_recording_call_index
-    ), "Beep was not played before recording greeting"
-
-
-def test_setup_shutdown_button(guest_book, mock_button):
-    """Test shutdown button setup."""
-    # Ensure config has default values for shutdown button
-    guest_book.config["shutdown_gpio"] = 22  # As per default mock_config
-    guest_book.config["shutdown_button_hold_time"] = 2  # As per default mock_config
-
-    mock_button.reset_mock()
-    guest_book.setup_shutdown_button()
-
-    expected_hold_time = guest_book.config["shutdown_button_hold_time"]
-    mock_button.assert_called_once_with(
-        guest_book.config["shutdown_gpio"], pull_up=True, hold_time=expected_hold_time
+    assert_call_order(
+        mock_audio_interface,
+        call.play_audio(
+            beep_file,
+            guest_book.config["beep_volume"],
+            guest_book.config["beep_start_delay"],
+        ),
+        call.start_recording(greeting_file_path_for_method),
     )
-    assert mock_button.return_value.when_held == guest_book.shutdown
-
 
-def test_setup_shutdown_button_disabled(guest_book, mock_button):
-    """Test shutdown button setup when GPIO is 0 (disabled)."""
-    guest_book.config["shutdown_gpio"] = 0
-    mock_button.reset_mock()
 
-    guest_book.setup_shutdown_button()
-
-    mock_button.assert_not_called()
-
-
-def test_init_creates_recordings_dir(
-    tmp_path, mock_config, mock_audio_interface, mock_button
-):
+def test_init_creates_recordings_dir(tmp_path, mock_config, mutable_guest_book):
     """Test __init__ creates the recordings directory if it does not exist."""
     recordings_path = tmp_path / "recordings"
     mock_config["recordings_path"] = str(recordings_path)
-    config_path = tmp_path / "config.yaml"
-    with open(config_path, "w") as f:
-        yaml.dump(mock_config, f)
-    with patch("rotary_guestbook.audioGuestBook.AudioInterface"):
-        assert not recordings_path.exists()
-        AudioGuestBook(str(config_path))
-        assert recordings_path.exists()
+    assert not recordings_path.exists()
+    mutable_guest_book()
+    assert recordings_path.exists()
 
 
 def test_shutdown_calls_os_system(guest_book):
@@ -530,14 +539,14 @@ def test_shutdown_calls_os_system(guest_book):
 def test_stop_recording_and_playback_no_recording(guest_book, mock_audio_interface):
     """Test stop_recording_and_playback when no active recording process."""
     mock_audio_interface.recording_process = None
-    mock_audio_interface.playback_process = MagicMock()
+    mock_audio_interface.playback_process = object()
     guest_book.stop_recording_and_playback()
     mock_audio_interface.stop_playback.assert_called_once()
 
 
 def test_stop_recording_and_playback_no_playback(guest_book, mock_audio_interface):
     """Test stop_recording_and_playback when no active playback process."""
-    mock_audio_interface.recording_process = MagicMock()
+    mock_audio_interface.recording_process = object()
     mock_audio_interface.playback_process = None
     guest_book.stop_recording_and_playback()
     mock_audio_interface.stop_recording.assert_called_once()
@@ -23,10 +23,12 @@ Example:
 """
 
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional, Type, TypeVar
 from unittest.mock import patch
 
 import pytest
+import yaml
+from pydantic import BaseModel, ValidationError
 
 from rotary_guestbook.config import (
     AudioSettings,
@@ -41,90 +43,187 @@ from rotary_guestbook.config import (
 )
 from rotary_guestbook.errors import ConfigError
 
+# Baseline models for the boundary checks; valid cases copy these and validate
+# only the field under test instead of building every field from scratch.
+_BASE_AUDIO = AudioSettings()
+_BASE_RECORDING = RecordingSettings()
+_BASE_CONVERSION = ConversionSettings()
+_BASE_SYSTEM = SystemSettings()
+# Built on first use by test_default_values; the defaults never change.
+_DEFAULT_CONFIG: Optional[Config] = None
 
-@pytest.fixture
-def valid_config_data() -> Dict[str, Any]:
-    """Create a valid configuration data dictionary.
+_M = TypeVar("_M", bound=BaseModel)
+
+
+def _copy_with(base: _M, **update: Any) -> _M:
+    """Copy a baseline model, validating just the updated fields.
+
+    Args:
+        base: The baseline model to copy
+        **update: Field values to validate and assign on the copy
 
     Returns:
-        A dictionary containing valid configuration data for testing
+        The updated copy
+
+    Raises:
+        ValidationError: If an updated value fails the field's validation
     """
-    return {
-        "audio": {
-            "output_device_index": None,  # Or some valid index
-            "greeting_message_path": "path/to/greeting.wav",
-            "min_recording_time": 3,
-            "silence_threshold": 0.01,
-            "silence_duration": 2,
-            "output_directory": "recordings",
-            "recording": {
-                "input_device_index": None,  # Or some valid index
-                "rate": 44100,
-                "channels": 2,
-                "sample_width": 2,
-                "chunk_size": 1024,
-                "max_duration_seconds": 300,
-            },
-            "conversion": {
-                "mp3_bitrate": "128k",
-                "ffmpeg_parameters": None,
-            },
-        },
-        "hardware": {
-            "hook_switch_pin": 17,
-            "rotary_pulse_pin": 27,
-            "rotary_dial_pin": 22,
-            "hook_switch_debounce": 50,
-            "rotary_pulse_debounce": 10,
-        },
-        "web": {
-            "host": "0.0.0.0",
-            "port": 5000,
-            "debug": False,
-            "secret_key": "test_key",
-            "auth_enabled": True,
-            "auth_username": "admin",
-            "auth_password": "password",
-        },
-        "logging": {
-            "level": "INFO",
-            "format": "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-            "file": "test.log",
-            "max_size": 10485760,
-            "backup_count": 5,
+    model = base.model_copy()
+    for field, value in update.items():
+        type(model).__pydantic_validator__.validate_assignment(model, field, value)
+    return model
+
+
+def _with_rate(config: Config, rate: int) -> Config:
+    """Return a copy of a frozen config with a different recording rate."""
+    recording = config.audio.recording.model_copy(update={"rate": rate})
+    audio = config.audio.model_copy(update={"recording": recording})
+    return config.model_copy(update={"audio": audio})
+
+
+def _check_boundary(
+    model_cls: Type[_M],
+    base: _M,
+    field: str,
+    value: Any,
+    exc: Optional[Type[Exception]],
+) -> None:
+    """Check a single field value is accepted or rejected as expected.
+
+    Args:
+        model_cls: The settings model under test
+        base: Baseline instance of the model used for valid values
+        field: Name of the field under test
+        value: Value to validate
+        exc: Expected exception type, or None if the value is valid
+    """
+    if exc is not None:
+        with pytest.raises(exc) as exc_info:
+            model_cls(**{field: value})
+        assert field in str(exc_info.value)
+    else:
+        assert getattr(_copy_with(base, **{field: value}), field) == value
+
+
+# Valid configuration written to the shared config file; never mutate.
+_VALID_CONFIG_DATA: Dict[str, Any] = {
+    "audio": {
+        "output_device_index": None,  # Or some valid index
+        "greeting_message_path": "path/to/greeting.wav",
+        "min_recording_time": 3,
+        "silence_threshold": 0.01,
+        "silence_duration": 2,
+        "output_directory": "recordings",
+        "recording": {
+            "input_device_index": None,  # Or some valid index
+            "rate": 44100,
+            "channels": 2,
+            "sample_width": 2,
+            "chunk_size": 1024,
+            "max_duration_seconds": 300,
         },
-        "system": {
-            "health_check_interval": 300,
-            "disk_space_threshold": 90,
-            "cpu_usage_threshold": 80,
-            "memory_usage_threshold": 80,
-            "archive_enabled": True,
-            "archive_interval": 86400,
-            "archive_keep_local": True,
-            "archive_backup_location": "backups",
+        "conversion": {
+            "mp3_bitrate": "128k",
+            "ffmpeg_parameters": None,
         },
-    }
+    },
+    "hardware": {
+        "hook_switch_pin": 17,
+        "rotary_pulse_pin": 27,
+        "rotary_dial_pin": 22,
+        "hook_switch_debounce": 50,
+        "rotary_pulse_debounce": 10,
+    },
+    "web": {
+        "host": "0.0.0.0",
+        "port": 5000,
+        "debug": False,
+        "secret_key": "test_key",
+        "auth_enabled": True,
+        "auth_username": "admin",
+        "auth_password": "password",
+    },
+    "logging": {
+        "level": "INFO",
+        "format": "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        "file": "test.log",
+        "max_size": 10485760,
+        "backup_count": 5,
+    },
+    "system": {
+        "health_check_interval": 300,
+        "disk_space_threshold": 90,
+        "cpu_usage_threshold": 80,
+        "memory_usage_threshold": 80,
+        "archive_enabled": True,
+        "archive_interval": 86400,
+        "archive_keep_local": True,
+        "archive_backup_location": "backups",
+    },
+}
+
+
+@pytest.fixture(scope="session")
+def _valid_config_yaml(safe_dumper: Type[yaml.SafeDumper]) -> bytes:
+    """Serialize the valid configuration data to YAML once per session.
 
+    Args:
+        safe_dumper: The PyYAML safe dumper class shared by the suite
+
+    Returns:
+        The encoded YAML document
+    """
+    return yaml.dump(_VALID_CONFIG_DATA, Dumper=safe_dumper).encode()
 
-@pytest.fixture
-def config_file(tmp_path: Path, valid_config_data: Dict[str, Any]) -> Path:
-    """Create a temporary configuration file with valid data.
+
+@pytest.fixture(scope="session")
+def config_file(
+    tmp_path_factory: pytest.TempPathFactory, _valid_config_yaml: bytes
+) -> Path:
+    """Create a read-only configuration file with valid data, once per session.
 
     Args:
-        tmp_path: Pytest fixture providing a temporary directory
-        valid_config_data: Fixture providing valid configuration data
+        tmp_path_factory: Pytest fixture for creating session temporary directories
+        _valid_config_yaml: The valid configuration serialized as YAML
 
     Returns:
-        Path to the temporary configuration file
+        Path to the shared configuration file
     """
-    config_path = tmp_path / "config.yaml"
-    with open(config_path, "w") as f:
-        import yaml
-
-        yaml.dump(valid_config_data, f)
+    config_path = tmp_path_factory.mktemp("cfg") / "config.yaml"
+    config_path.write_bytes(_valid_config_yaml)
     return config_path
 
 
+@pytest.fixture(scope="session")
+def _parsed_config(config_file: Path) -> Config:
+    """Parse the shared configuration file once per session.
+
+    Args:
+        config_file: Path to the shared configuration file
+
+    Returns:
+        The validated configuration
+    """
+    return ConfigManager(str(config_file)).config
+
+
+@pytest.fixture
+def loaded_manager(config_file: Path, _parsed_config: Config) -> ConfigManager:
+    """Provide a manager for the shared configuration file without re-parsing it.
+
+    The settings models are frozen, so managers can share the parsed config.
+
+    Args:
+        config_file: Path to the shared configuration file
+        _parsed_config: The configuration parsed from config_file
+
+    Returns:
+        A manager for config_file holding the session's parsed configuration
+    """
+    with patch.object(ConfigManager, "_load_config", return_value=_parsed_config):
+        return ConfigManager(str(config_file))
+
+
 def test_load_valid_config(config_file: Path) -> None:
     """Test loading a valid configuration file.
 
@@ -179,7 +278,10 @@ def test_load_invalid_config(tmp_path: Path) -> None:
 
 def test_default_values() -> None:
     """Test that default values are used when not specified in config."""
-    config = Config()
+    global _DEFAULT_CONFIG
+    if _DEFAULT_CONFIG is None:
+        _DEFAULT_CONFIG = Config()
+    config = _DEFAULT_CONFIG
     assert config.audio.recording.rate == 44100
     assert config.audio.recording.channels == 1
     assert config.hardware.hook_switch_pin == 17
@@ -188,6 +290,13 @@ def test_default_values() -> None:
     assert config.system.health_check_interval == 300
 
 
+def test_settings_are_frozen() -> None:
+    """Test that settings cannot be changed in place."""
+    with pytest.raises(ValidationError):
+        setattr(_BASE_RECORDING, "rate", 48000)
+    assert _BASE_RECORDING.rate == 44100
+
+
 def test_audio_settings_validation() -> None:
     """Test validation of audio settings."""
     # Test invalid output_directory
@@ -199,37 +308,43 @@ def test_audio_settings_validation() -> None:
         AudioSettings(output_directory="")
     assert "output_directory must be a non-empty string" in str(exc_info.value)
     # Valid case
-    assert AudioSettings(output_directory="rec").output_directory == "rec"
-
-    # Test min_recording_time boundaries (ge=1, le=60)
-    with pytest.raises(ValueError):
-        AudioSettings(min_recording_time=0)
-    with pytest.raises(ValueError):
-        AudioSettings(min_recording_time=61)
-    assert AudioSettings(min_recording_time=1).min_recording_time == 1
-    assert AudioSettings(min_recording_time=60).min_recording_time == 60
-
-    # Test silence_threshold boundaries (ge=0.0, le=1.0)
-    with pytest.raises(ValueError):
-        AudioSettings(silence_threshold=-0.1)
-    with pytest.raises(ValueError):
-        AudioSettings(silence_threshold=1.1)
-    assert AudioSettings(silence_threshold=0.0).silence_threshold == 0.0
-    assert AudioSettings(silence_threshold=1.0).silence_threshold == 1.0
-
-    # Test silence_duration boundaries (ge=1, le=10)
-    with pytest.raises(ValueError):
-        AudioSettings(silence_duration=0)
-    with pytest.raises(ValueError):
-        AudioSettings(silence_duration=11)
-    assert AudioSettings(silence_duration=1).silence_duration == 1
-    assert AudioSettings(silence_duration=10).silence_duration == 10
+    assert _copy_with(_BASE_AUDIO, output_directory="rec").output_directory == "rec"
 
     # Test that default RecordingSettings and ConversionSettings are valid
     assert AudioSettings().recording is not None
     assert AudioSettings().conversion is not None
 
 
+AUDIO_BOUNDARY_CASES = [
+    ("min_recording_time", 0, ValueError),
+    ("min_recording_time", 61, ValueError),
+    ("min_recording_time", 1, None),
+    ("min_recording_time", 60, None),
+    ("silence_threshold", -0.1, ValueError),
+    ("silence_threshold", 1.1, ValueError),
+    ("silence_threshold", 0.0, None),
+    ("silence_threshold", 1.0, None),
+    ("silence_duration", 0, ValueError),
+    ("silence_duration", 11, ValueError),
+    ("silence_duration", 1, None),
+    ("silence_duration", 10, None),
+]
+
+
+@pytest.mark.parametrize("field,value,exc", AUDIO_BOUNDARY_CASES)
+def test_audio_settings_boundaries(
+    field: str, value: Any, exc: Optional[Type[Exception]]
+) -> None:
+    """Test validation of audio settings at each field boundary.
+
+    Args:
+        field: Name of the field under test
+        value: Value to validate
+        exc: Expected exception type, or None if the value is valid
+    """
+    _check_boundary(AudioSettings, _BASE_AUDIO, field, value, exc)
+
+
 def test_hardware_settings_validation() -> None:
     """Test validation of hardware settings."""
     # Test invalid GPIO pin
@@ -274,144 +389,158 @@ def test_logging_settings_validation() -> None:
     assert "backup_count" in str(exc_info.value)
 
 
-def test_system_settings_validation() -> None:
-    """Test validation of system settings."""
-    # Test invalid health check interval
-    with pytest.raises(ValueError) as exc_info:
-        SystemSettings(health_check_interval=30)  # Below minimum
-    assert "health_check_interval" in str(exc_info.value)
-    assert SystemSettings(health_check_interval=60).health_check_interval == 60
-
-    # Test invalid disk space threshold
-    with pytest.raises(ValueError) as exc_info:
-        SystemSettings(disk_space_threshold=40)  # Below minimum
-    assert "disk_space_threshold" in str(exc_info.value)
-    with pytest.raises(ValueError):
-        SystemSettings(disk_space_threshold=101)  # Above maximum
-    assert SystemSettings(disk_space_threshold=50).disk_space_threshold == 50
-    assert SystemSettings(disk_space_threshold=100).disk_space_threshold == 100
-
-    # Test cpu_usage_threshold boundaries (ge=50, le=100)
-    with pytest.raises(ValueError):
-        SystemSettings(cpu_usage_threshold=49)
-    with pytest.raises(ValueError):
-        SystemSettings(cpu_usage_threshold=101)
-    assert SystemSettings(cpu_usage_threshold=50).cpu_usage_threshold == 50
-    assert SystemSettings(cpu_usage_threshold=100).cpu_usage_threshold == 100
-
-    # Test memory_usage_threshold boundaries (ge=50, le=100)
-    with pytest.raises(ValueError):
-        SystemSettings(memory_usage_threshold=49)
-    with pytest.raises(ValueError):
-        SystemSettings(memory_usage_threshold=101)
-    assert SystemSettings(memory_usage_threshold=50).memory_usage_threshold == 50
-    assert SystemSettings(memory_usage_threshold=100).memory_usage_threshold == 100
+SYSTEM_BOUNDARY_CASES = [
+    ("health_check_interval", 30, ValueError),
+    ("health_check_interval", 60, None),
+    ("disk_space_threshold", 40, ValueError),
+    ("disk_space_threshold", 101, ValueError),
+    ("disk_space_threshold", 50, None),
+    ("disk_space_threshold", 100, None),
+    ("cpu_usage_threshold", 49, ValueError),
+    ("cpu_usage_threshold", 101, ValueError),
+    ("cpu_usage_threshold", 50, None),
+    ("cpu_usage_threshold", 100, None),
+    ("memory_usage_threshold", 49, ValueError),
+    ("memory_usage_threshold", 101, ValueError),
+    ("memory_usage_threshold", 50, None),
+    ("memory_usage_threshold", 100, None),
+    ("archive_interval", 1800, ValueError),
+    ("archive_interval", 3600, None),
+]
+
+
+@pytest.mark.parametrize("field,value,exc", SYSTEM_BOUNDARY_CASES)
+def test_system_settings_validation(
+    field: str, value: Any, exc: Optional[Type[Exception]]
+) -> None:
+    """Test validation of system settings at each field boundary.
 
-    # Test invalid archive interval
-    with pytest.raises(ValueError) as exc_info:
-        SystemSettings(archive_interval=1800)  # Below minimum
-    assert "archive_interval" in str(exc_info.value)
-    assert SystemSettings(archive_interval=3600).archive_interval == 3600
+    Args:
+        field: Name of the field under test
+        value: Value to validate
+        exc: Expected exception type, or None if the value is valid
+    """
+    _check_boundary(SystemSettings, _BASE_SYSTEM, field, value, exc)
 
 
-def test_save_config(config_file: Path) -> None:
-    """Test saving configuration to a file.
+def test_save_config(
+    loaded_manager: ConfigManager, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test save_config writes YAML that keeps field order and round-trips.
 
     Args:
-        config_file: Path to a temporary configuration file
+        loaded_manager: Manager for the shared configuration file
+        monkeypatch: Pytest fixture for patching attributes
     """
-    config_manager = ConfigManager(str(config_file))
-    config_manager.audio.recording.rate = 48000
-    config_manager.save_config()
+    written: List[str] = []
 
-    reloaded_config_manager = ConfigManager(str(config_file))
-    assert reloaded_config_manager.audio.recording.rate == 48000
+    def _capture_write(self: ConfigManager, path: Path, data: str) -> None:
+        assert path == loaded_manager.config_path
+        written.append(data)
 
+    # Capture the emitted YAML instead of touching the file
+    monkeypatch.setattr(ConfigManager, "_write", _capture_write)
+    loaded_manager.config = _with_rate(loaded_manager.config, 48000)
+    loaded_manager.save_config()
 
-def test_save_config_error(config_file: Path) -> None:
-    """Test error handling when saving configuration.
+    assert len(written) == 1
+    saved = yaml.safe_load(written[0])
+    # Sections and their fields are written in model order, not sorted
+    assert list(saved) == list(Config.model_fields)
+    assert list(saved["audio"]) == list(AudioSettings.model_fields)
+    assert list(saved["web"]) == list(WebSettings.model_fields)
 
-    Args:
-        config_file: Path to a temporary configuration file
-    """
-    config_manager = ConfigManager(str(config_file))
-    with patch("pathlib.Path.open", side_effect=IOError("Permission denied")):
-        with pytest.raises(ConfigError) as exc_info:
-            config_manager.save_config()
-        assert "Failed to save configuration" in str(exc_info.value)
+    reparsed = Config.model_validate(saved)
+    assert reparsed.audio.recording.rate == 48000
 
 
-def test_property_access(config_file: Path) -> None:
-    """Test accessing configuration properties.
+def test_save_config_error(
+    loaded_manager: ConfigManager, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test error handling when saving configuration.
 
     Args:
-        config_file: Path to a temporary configuration file
+        loaded_manager: Manager for the shared configuration file
+        monkeypatch: Pytest fixture for patching attributes
     """
-    config_manager = ConfigManager(str(config_file))
-    assert isinstance(config_manager.audio, AudioSettings)
-    assert isinstance(config_manager.hardware, HardwareSettings)
-    assert isinstance(config_manager.web, WebSettings)
-    assert isinstance(config_manager.logging, LoggingSettings)
-    assert isinstance(config_manager.system, SystemSettings)
 
+    def _fail_write(self: ConfigManager, path: Path, data: str) -> None:
+        raise IOError("Permission denied")
 
-def test_recording_settings_validation() -> None:
-    """Test validation of recording settings."""
-    # rate: ge=8000, le=192000
-    with pytest.raises(ValueError):
-        RecordingSettings(rate=7999)
-    with pytest.raises(ValueError):
-        RecordingSettings(rate=192001)
-    assert RecordingSettings(rate=8000).rate == 8000
-    assert RecordingSettings(rate=192000).rate == 192000
+    monkeypatch.setattr(ConfigManager, "_write", _fail_write)
+    with pytest.raises(ConfigError) as exc_info:
+        loaded_manager.save_config()
+    assert "Failed to save configuration" in str(exc_info.value)
 
-    # channels: ge=1, le=2
-    with pytest.raises(ValueError):
-        RecordingSettings(channels=0)
-    with pytest.raises(ValueError):
-        RecordingSettings(channels=3)
-    assert RecordingSettings(channels=1).channels == 1
-    assert RecordingSettings(channels=2).channels == 2
 
-    # sample_width: ge=1, le=4
-    with pytest.raises(ValueError):
-        RecordingSettings(sample_width=0)
-    with pytest.raises(ValueError):
-        RecordingSettings(sample_width=5)
-    assert RecordingSettings(sample_width=1).sample_width == 1
-    assert RecordingSettings(sample_width=4).sample_width == 4
-
-    # chunk_size: ge=256, le=8192
-    with pytest.raises(ValueError):
-        RecordingSettings(chunk_size=255)
-    with pytest.raises(ValueError):
-        RecordingSettings(chunk_size=8193)
-    assert RecordingSettings(chunk_size=256).chunk_size == 256
-    assert RecordingSettings(chunk_size=8192).chunk_size == 8192
+def test_property_access(loaded_manager: ConfigManager) -> None:
+    """Test accessing configuration properties.
 
-    # max_duration_seconds: ge=10, le=600
-    with pytest.raises(ValueError):
-        RecordingSettings(max_duration_seconds=9)
-    with pytest.raises(ValueError):
-        RecordingSettings(max_duration_seconds=601)
-    assert RecordingSettings(max_duration_seconds=10).max_duration_seconds == 10
-    assert RecordingSettings(max_duration_seconds=600).max_duration_seconds == 600
+    Args:
+        loaded_manager: Manager for the shared configuration file
+    """
+    config_manager = loaded_manager
+    assert type(config_manager.audio) is AudioSettings
+    assert type(config_manager.hardware) is HardwareSettings
+    assert type(config_manager.web) is WebSettings
+    assert type(config_manager.logging) is LoggingSettings
+    assert type(config_manager.system) is SystemSettings
+
+
+RECORDING_BOUNDARY_CASES = [
+    ("rate", 7999, ValueError),
+    ("rate", 192001, ValueError),
+    ("rate", 8000, None),
+    ("rate", 192000, None),
+    ("channels", 0, ValueError),
+    ("channels", 3, ValueError),
+    ("channels", 1, None),
+    ("channels", 2, None),
+    ("sample_width", 0, ValueError),
+    ("sample_width", 5, ValueError),
+    ("sample_width", 1, None),
+    ("sample_width", 4, None),
+    ("chunk_size", 255, ValueError),
+    ("chunk_size", 8193, ValueError),
+    ("chunk_size", 256, None),
+    ("chunk_size", 8192, None),
+    ("max_duration_seconds", 9, ValueError),
+    ("max_duration_seconds", 601, ValueError),
+    ("max_duration_seconds", 10, None),
+    ("max_duration_seconds", 600, None),
+    ("input_device_index", None, None),
+    ("input_device_index", 1, None),
+]
+
+
+@pytest.mark.parametrize("field,value,exc", RECORDING_BOUNDARY_CASES)
+def test_recording_settings_validation(
+    field: str, value: Any, exc: Optional[Type[Exception]]
+) -> None:
+    """Test validation of recording settings at each field boundary.
 
-    # input_device_index is Optional[int], Pydantic handles type. Valid examples:
-    assert RecordingSettings(input_device_index=None).input_device_index is None
-    assert RecordingSettings(input_device_index=1).input_device_index == 1
+    Args:
+        field: Name of the field under test
+        value: Value to validate
+        exc: Expected exception type, or None if the value is valid
+    """
+    _check_boundary(RecordingSettings, _BASE_RECORDING, field, value, exc)
 
 
 def test_conversion_settings_validation() -> None:
     """Test validation of conversion settings."""
     # mp3_bitrate: str
-    assert ConversionSettings(mp3_bitrate="128k").mp3_bitrate == "128k"
+    assert _copy_with(_BASE_CONVERSION, mp3_bitrate="128k").mp3_bitrate == "128k"
     with pytest.raises(ValueError):  # Pydantic's ValidationError
         ConversionSettings(mp3_bitrate=128)
 
     # ffmpeg_parameters: Optional[List[str]]
-    assert ConversionSettings(ffmpeg_parameters=None).ffmpeg_parameters is None
-    assert ConversionSettings(ffmpeg_parameters=["-ac", "1"]).ffmpeg_parameters == [
+    assert (
+        _copy_with(_BASE_CONVERSION, ffmpeg_parameters=None).ffmpeg_parameters is None
+    )
+    assert _copy_with(
+        _BASE_CONVERSION, ffmpeg_parameters=["-ac", "1"]
+    ).ffmpeg_parameters == [
         "-ac",
         "1",
     ]
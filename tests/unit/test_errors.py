@@ -26,6 +26,10 @@ Note:
     also be run independently for quick verification of the error handling system.
 """
 
+from typing import Type
+
+import pytest
+
 from rotary_guestbook.errors import (
     ArchiveError,
     AudioError,
@@ -36,6 +40,16 @@ from rotary_guestbook.errors import (
     WebError,
 )
 
+# Every GuestbookError subclass, shared by the parametrized tests
+ERROR_CLASSES = (
+    ConfigError,
+    AudioError,
+    HardwareError,
+    ArchiveError,
+    WebError,
+    HealthError,
+)
+
 
 def test_guestbook_error_basic() -> None:
     """Test basic GuestbookError initialization and string representation.
@@ -83,65 +97,30 @@ def test_guestbook_error_with_details() -> None:
     assert error.details == "Additional details"
 
 
-def test_error_inheritance() -> None:
-    """Test that all custom errors inherit from GuestbookError.
+@pytest.mark.parametrize("error_class", ERROR_CLASSES)
+def test_error_subclass(error_class: Type[GuestbookError]) -> None:
+    """Test each custom error's inheritance and message formatting.
 
     This test verifies that:
-    1. All custom exception classes properly inherit from GuestbookError
-    2. All exceptions are also instances of the base Exception class
-    3. The inheritance hierarchy is maintained for all error types
+    1. The error class properly inherits from GuestbookError and Exception
+    2. The error preserves its message and details
+    3. The string representation combines message and details uniformly
 
-    Example:
-        ```python
-        error = ConfigError("Test")
-        assert isinstance(error, GuestbookError)
-        assert isinstance(error, Exception)
-        ```
-    """
-    errors = [
-        ConfigError("Config error"),
-        AudioError("Audio error"),
-        HardwareError("Hardware error"),
-        ArchiveError("Archive error"),
-        WebError("Web error"),
-        HealthError("Health error"),
-    ]
-
-    for error in errors:
-        assert isinstance(error, GuestbookError)
-        assert isinstance(error, Exception)
-
-
-def test_error_messages() -> None:
-    """Test that each error type maintains its specific message.
-
-    This test verifies that:
-    1. Each error type correctly preserves its message and details
-    2. The string representation is consistent across all error types
-    3. The formatting of messages with details is uniform
+    Args:
+        error_class: The custom exception class under test
 
     Example:
         ```python
+        assert issubclass(ConfigError, GuestbookError)
         error = ConfigError("Test message", "Test details")
         assert str(error) == "Test message - Test details"
         ```
     """
-    test_message = "Test message"
-    test_details = "Test details"
-
-    config_error = ConfigError(test_message, test_details)
-    audio_error = AudioError(test_message, test_details)
-    hardware_error = HardwareError(test_message, test_details)
-    archive_error = ArchiveError(test_message, test_details)
-    web_error = WebError(test_message, test_details)
-    health_error = HealthError(test_message, test_details)
-
-    assert str(config_error) == f"{test_message} - {test_details}"
-    assert str(audio_error) == f"{test_message} - {test_details}"
-    assert str(hardware_error) == f"{test_message} - {test_details}"
-    assert str(archive_error) == f"{test_message} - {test_details}"
-    assert str(web_error) == f"{test_message} - {test_details}"
-    assert str(health_error) == f"{test_message} - {test_details}"
+    assert issubclass(error_class, GuestbookError)
+    assert issubclass(error_class, Exception)
+
+    error = error_class("Test message", "Test details")
+    assert str(error) == "Test message - Test details"
 
 
 def test_error_attributes() -> None:
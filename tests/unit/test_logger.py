@@ -4,20 +4,28 @@ This module contains tests for the logging setup functionality, including handle
 configuration, log level validation, and file rotation.
 """
 
+import io
 import logging
-import tempfile
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Generator
+from typing import Any, Generator, cast
 
 import pytest
 
-from rotary_guestbook.config import ConfigManager
-from rotary_guestbook.logger import get_logger, setup_logging
+from rotary_guestbook.config import Config, ConfigManager, LoggingSettings
+from rotary_guestbook.logger import _build_handlers, get_logger, setup_logging
+
+
+@pytest.fixture(scope="session", autouse=True)
+def shutdown_logging() -> Generator[None, None, None]:
+    """Flush and close every logging handler once, at the end of the session."""
+    yield
+    logging.shutdown()
 
 
 @pytest.fixture(autouse=True)
 def cleanup_logging_handlers() -> Generator[None, None, None]:
-    """Ensure logging is enabled, and close handlers after each test."""
+    """Ensure logging is enabled, and close root handlers after each test."""
     # Cache the current global disable level
     original_disable_level = logging.root.manager.disable
     # Ensure all logging levels are enabled for the duration of the test
@@ -25,82 +33,113 @@ def cleanup_logging_handlers() -> Generator[None, None, None]:
 
     yield  # Run the test
 
-    # Shutdown all logging handlers (flushes and closes them)
-    logging.shutdown()
+    # Detach and close only the root logger's handlers; walking every
+    # handler with logging.shutdown() is left to the session teardown.
+    root_logger = logging.getLogger()
+    for handler in root_logger.handlers[:]:
+        root_logger.removeHandler(handler)
+        handler.close()
     # Restore the original global disable level
     logging.disable(original_disable_level)
 
 
-@pytest.fixture
-def temp_log_dir() -> Generator[Path, None, None]:
-    """Create a temporary directory for log files.
+@pytest.fixture(scope="session")
+def _log_root(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create one directory for every test's log file, once per session.
+
+    Args:
+        tmp_path_factory: Pytest fixture for creating session temporary directories.
 
-    Yields:
-        Path to the temporary directory.
+    Returns:
+        Path to the shared log directory.
     """
-    with tempfile.TemporaryDirectory() as temp_dir:
-        yield Path(temp_dir)
+    return tmp_path_factory.mktemp("logs")
+
+
+def _update_logging(config: ConfigManager, **update: Any) -> None:
+    """Replace the manager's logging settings with an updated copy.
+
+    The settings models are frozen, so changes go through ``model_copy``.
+
+    Args:
+        config: The configuration manager to update
+        **update: Logging fields to override
+    """
+    logging_settings = config.config.logging.model_copy(update=update)
+    config.config = config.config.model_copy(update={"logging": logging_settings})
+
+
+@dataclass
+class _StubConfigManager:
+    """Stand-in for ConfigManager exposing only what setup_logging reads."""
+
+    config: Config
 
 
 @pytest.fixture
-def mock_config(temp_log_dir: Path) -> ConfigManager:
-    """Create a mock configuration with logging settings.
+def mock_config(_log_root: Path, request: pytest.FixtureRequest) -> ConfigManager:
+    """Create a stub configuration with test logging settings.
 
     Args:
-        temp_log_dir: Path to the temporary directory for log files.
+        _log_root: Shared directory for the tests' log files.
+        request: Pytest request, used to give each test its own log file.
 
     Returns:
-        A ConfigManager instance with test logging settings.
+        A ConfigManager stand-in with test logging settings.
     """
-    config = ConfigManager("config.yaml")
-    config.config.logging.level = "DEBUG"
-    config.config.logging.format = (
-        "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    logging_settings = LoggingSettings(
+        level="DEBUG",
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        file=str(_log_root / f"{request.node.name}.log"),
+        max_size=1024,
+        backup_count=3,
     )
-    config.config.logging.file = str(temp_log_dir / "test.log")
-    config.config.logging.max_size = 1024
-    config.config.logging.backup_count = 3
-    return config
+    return cast(ConfigManager, _StubConfigManager(Config(logging=logging_settings)))
 
 
 def test_setup_logging_handlers(mock_config: ConfigManager) -> None:
-    """Test that logging setup configures both console and file handlers."""
-    setup_logging(mock_config)
-    root_logger = logging.getLogger()
-    handlers = root_logger.handlers
+    """Test that logging setup builds both console and file handlers."""
+    log_settings = mock_config.config.logging
+    handlers = _build_handlers(log_settings, delay=True)
 
     assert len(handlers) == 2
     assert any(isinstance(h, logging.StreamHandler) for h in handlers)
     assert any(isinstance(h, logging.handlers.RotatingFileHandler) for h in handlers)
+    # Building the handlers with delay=True must not open the log file
+    assert not Path(log_settings.file).exists()
 
 
 def test_setup_logging_level(mock_config: ConfigManager) -> None:
-    """Test that log level is set correctly."""
-    setup_logging(mock_config)
-    root_logger = logging.getLogger()
-    assert root_logger.level == logging.DEBUG
+    """Test that the file handler's log level is set correctly."""
+    handlers = _build_handlers(mock_config.config.logging, delay=True)
+    file_handler = handlers[1]
+    assert isinstance(file_handler, logging.handlers.RotatingFileHandler)
+    assert file_handler.level == logging.DEBUG
 
 
 def test_setup_logging_format(mock_config: ConfigManager) -> None:
     """Test that log format is set correctly."""
-    setup_logging(mock_config)
-    root_logger = logging.getLogger()
-    formatter = root_logger.handlers[0].formatter
-    assert formatter is not None
-    assert formatter._fmt == mock_config.config.logging.format
+    for handler in _build_handlers(mock_config.config.logging, delay=True):
+        formatter = handler.formatter
+        assert formatter is not None
+        assert formatter._fmt == mock_config.config.logging.format
 
 
 def test_setup_logging_file_creation(mock_config: ConfigManager) -> None:
-    """Test that log file is created."""
+    """Test that log file is created and the root logger level is set."""
     log_file = Path(mock_config.config.logging.file)
     setup_logging(mock_config)
     assert log_file.exists()
+    assert logging.getLogger().level == logging.DEBUG
+    assert [type(h) for h in logging.getLogger().handlers] == [
+        logging.StreamHandler,
+        logging.handlers.RotatingFileHandler,
+    ]
 
 
 def test_setup_logging_file_rotation(mock_config: ConfigManager) -> None:
     """Test that log files rotate when they reach max size."""
     logging.disable(logging.NOTSET)  # Ensure global disable is not active
-    log_file = Path(mock_config.config.logging.file)
 
     # Explicitly get/clean the test module's logger before setup_logging.
     # This ensures it's in a known state. Set level to DEBUG to ensure
@@ -117,30 +156,34 @@ def test_setup_logging_file_rotation(mock_config: ConfigManager) -> None:
     setup_logger = get_logger(__name__)
     assert setup_logger is logger_instance_for_test
 
+    file_handler = next(
+        h
+        for h in logging.getLogger().handlers
+        if isinstance(h, logging.handlers.RotatingFileHandler)
+    )
+    assert int(file_handler.maxBytes) == 1024
+    assert file_handler.backupCount == 3
+
+    # Keep the writes and renames off disk: log into memory and count the
+    # rollovers the handler decides to do instead of performing them.
+    streams = [io.StringIO()]
+
+    def fake_rollover() -> None:
+        streams.append(io.StringIO())
+        file_handler.stream = streams[-1]
+
+    file_handler.stream.close()
+    file_handler.stream = streams[0]
+    file_handler.doRollover = fake_rollover  # type: ignore
+
     # Write enough data to trigger rotation. Max size is 1024 bytes.
     # Each message is 100 chars + overhead.
     # 20 messages of "x" * 100 = 2000 chars, should be > 1KB.
     for i in range(20):
         setup_logger.info(f"Message {i}: {'x' * 100}")
 
-    # Flush handlers to ensure data is written before checking files.
-    # logging.shutdown() in the fixture should also do this.
-    for handler in logging.getLogger().handlers:  # Root handlers
-        handler.flush()
-    # The specific logger setup_logger shouldn't have its own handlers.
-    if hasattr(setup_logger, "handlers") and setup_logger.handlers:
-        for handler in setup_logger.handlers:
-            handler.flush()
-
-    # Check that backup files were created
-    backup_files = list(log_file.parent.glob("test.log.*"))
-    log_exists = log_file.exists()
-    log_size = log_file.stat().st_size if log_exists else "N/A"
-    assert_msg = (
-        f"Found {len(backup_files)} backup files in {log_file.parent}. "
-        f"Log file: {log_file}, Exists: {log_exists}, Size: {log_size}"
-    )
-    assert len(backup_files) > 0, assert_msg
+    assert len(streams) > 1, "Handler never rolled over after writing > maxBytes"
+    assert all(len(stream.getvalue()) < 1024 for stream in streams[:-1])
 
 
 def test_get_logger() -> None:
@@ -152,14 +195,22 @@ def test_get_logger() -> None:
 
 def test_setup_logging_invalid_level(mock_config: ConfigManager) -> None:
     """Test that invalid log level raises ValueError."""
-    mock_config.config.logging.level = "INVALID_LEVEL"
+    _update_logging(mock_config, level="INVALID_LEVEL")
     with pytest.raises(ValueError, match="Invalid log level"):
         setup_logging(mock_config)
 
 
-def test_setup_logging_file_permission_error(mock_config: ConfigManager) -> None:
+def test_setup_logging_file_permission_error(
+    mock_config: ConfigManager, monkeypatch: pytest.MonkeyPatch
+) -> None:
     """Test that file permission errors are handled correctly."""
-    mock_config.config.logging.file = "/root/test.log"
+
+    def deny(*args: Any, **kwargs: Any) -> logging.Handler:
+        raise PermissionError("Permission denied")
+
+    # Fail at handler creation rather than relying on filesystem permissions,
+    # which do not apply when the suite runs as root.
+    monkeypatch.setattr(logging.handlers, "RotatingFileHandler", deny)
     with pytest.raises(OSError, match="Failed to set up file logging"):
         setup_logging(mock_config)
 